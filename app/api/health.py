@@ -1,11 +1,25 @@
 """Health check endpoints."""
 
+import time
 from datetime import datetime
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.services.reply_service import reply_service
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Last refresh time and formatted timestamp shared by the probe endpoints
+_LAST_TS = [0.0, ""]
+
+
+def _iso_now() -> str:
+    """Return the current UTC time in ISO format, refreshed at most once a second."""
+    now = time.time()
+    if now - _LAST_TS[0] > 1.0:
+        _LAST_TS[0] = now
+        _LAST_TS[1] = datetime.utcfromtimestamp(now).isoformat()
+    return _LAST_TS[1]
 
 
 @router.get("/health")
@@ -14,7 +28,7 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "smart-reply-service",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _iso_now(),
     }
 
 
@@ -24,7 +38,7 @@ async def readiness_check():
     status = {
         "status": "ready",
         "service": "smart-reply-service",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _iso_now(),
         "models": {
             "reply_model": "loaded" if reply_service.initialized else "fallback",
         },
@@ -43,5 +57,5 @@ async def liveness_check():
     return {
         "status": "alive",
         "service": "smart-reply-service",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _iso_now(),
     }
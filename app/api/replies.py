@@ -1,6 +1,12 @@
 """Smart reply API endpoints."""
 
-from fastapi import APIRouter, HTTPException
+import re
+
+import msgspec
+import orjson
+from fastapi import APIRouter, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
 
 from app.services.reply_service import reply_service
 from app.schemas.reply import (
@@ -8,52 +14,146 @@ from app.schemas.reply import (
     ReplyResponse,
     QuickReplyRequest,
     QuickReplyResponse,
+    ReplyIntent,
+    ReplyTone,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Static payloads, serialized once at import
+_INTENTS_BYTES = orjson.dumps({"intents": [intent.value for intent in ReplyIntent]})
+_TONES_BYTES = orjson.dumps({"tones": [tone.value for tone in ReplyTone]})
+
+
+# msgspec only reports errors as text, e.g.
+# "Expected `int` <= 5 - at `$.num_suggestions`" or
+# "Object missing required field `sender_id` - at `$.context.messages[0]`".
+# The path suffix is omitted for errors at the top level.
+_ERROR_PATH_RE = re.compile(r"^(?P<msg>.*?)(?: - at `\$(?P<path>[^`]*)`)?$", re.S)
+_PATH_PART_RE = re.compile(r"\.(\w+)|\[(\d+)\]")
+_MISSING_FIELD_RE = re.compile(r"^Object missing required field `(?P<field>\w+)`$")
+
+
+def _validation_error(message: str) -> dict:
+    """Convert a msgspec validation message into a FastAPI-style error."""
+    match = _ERROR_PATH_RE.match(message)
+    msg, path = match["msg"], match["path"] or ""
+
+    loc = ["body"]
+    for key, index in _PATH_PART_RE.findall(path):
+        loc.append(key if key else int(index))
+
+    # FastAPI points missing-field errors at the field itself
+    missing = _MISSING_FIELD_RE.match(msg)
+    if missing:
+        loc.append(missing["field"])
+
+    return {"type": "value_error", "loc": loc, "msg": msg}
+
+
+def _decode_body(body: bytes, type_):
+    """Decode and validate a JSON request body into a msgspec struct.
+
+    Errors are raised as ``RequestValidationError`` so clients get the
+    same 422 ``{"detail": [{"type", "loc", "msg"}]}`` shape as FastAPI's
+    own body validation.
+    """
+    try:
+        return msgspec.json.decode(body, type=type_)
+    except msgspec.ValidationError as e:
+        raise RequestValidationError([_validation_error(str(e))])
+    except msgspec.DecodeError as e:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ["body"],
+                    "msg": "JSON decode error",
+                    "ctx": {"error": str(e)},
+                }
+            ]
+        )
+
+
+def _inline_schema(type_) -> dict:
+    """Build a self-contained JSON schema for a msgspec type.
+
+    msgspec emits ``#/$defs/...`` references, which don't resolve inside an
+    OpenAPI document, so the definitions are inlined.
+    """
+    schema = msgspec.json.schema(type_)
+    defs = schema.pop("$defs", {})
 
+    def resolve(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None:
+                return resolve(defs[ref.rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(item) for item in node]
+        return node
 
-@router.post("/suggest", response_model=ReplyResponse)
-async def suggest_replies(request: ReplyRequest):
+    return resolve(schema)
+
+
+def _openapi_body(request_type, response_type) -> dict:
+    """OpenAPI request/response docs for an endpoint that decodes its own body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema(request_type)}},
+        },
+        "responses": {
+            "200": {
+                "content": {
+                    "application/json": {"schema": _inline_schema(response_type)}
+                },
+            },
+        },
+    }
+
+
+def _json_response(result) -> Response:
+    """Encode a msgspec struct straight to a JSON response."""
+    return Response(content=msgspec.json.encode(result), media_type="application/json")
+
+
+@router.post("/suggest", openapi_extra=_openapi_body(ReplyRequest, ReplyResponse))
+async def suggest_replies(request: Request):
     """Generate smart reply suggestions based on conversation context.
 
     This endpoint analyzes the conversation context and generates
     AI-powered reply suggestions appropriate for the tone and context.
     """
-    if not request.context.messages:
-        raise HTTPException(
-            status_code=400,
-            detail="At least one message is required in the context",
-        )
+    reply_request = _decode_body(await request.body(), ReplyRequest)
 
-    return await reply_service.generate_replies(request)
+    result = await reply_service.generate_replies(reply_request)
+    return _json_response(result)
 
 
-@router.post("/quick", response_model=QuickReplyResponse)
-async def quick_replies(request: QuickReplyRequest):
+@router.post(
+    "/quick", openapi_extra=_openapi_body(QuickReplyRequest, QuickReplyResponse)
+)
+async def quick_replies(request: Request):
     """Get quick reply options for a single message.
 
     This is a lighter-weight endpoint for getting simple
     quick reply options without full context.
     """
-    return await reply_service.get_quick_replies(request)
+    quick_request = _decode_body(await request.body(), QuickReplyRequest)
+
+    result = await reply_service.get_quick_replies(quick_request)
+    return _json_response(result)
 
 
 @router.get("/intents")
 async def list_intents():
     """List available reply intents."""
-    from app.schemas.reply import ReplyIntent
-
-    return {
-        "intents": [intent.value for intent in ReplyIntent],
-    }
+    return Response(content=_INTENTS_BYTES, media_type="application/json")
 
 
 @router.get("/tones")
 async def list_tones():
     """List available reply tones."""
-    from app.schemas.reply import ReplyTone
-
-    return {
-        "tones": [tone.value for tone in ReplyTone],
-    }
+    return Response(content=_TONES_BYTES, media_type="application/json")
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
+    REDIS_TIMEOUT: float = 0.1  # seconds, for connect and commands
 
     # Cache TTL (seconds)
     CACHE_TTL: int = 3600  # 1 hour
@@ -24,12 +25,15 @@ class Settings(BaseSettings):
     # ML Models
     REPLY_MODEL: str = "microsoft/DialoGPT-medium"
     EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    QUANTIZE_MODEL: bool = False
 
     # Reply Settings
     MAX_REPLY_LENGTH: int = 100
     NUM_SUGGESTIONS: int = 3
     MIN_CONFIDENCE: float = 0.3
     MAX_CONTEXT_MESSAGES: int = 5
+    INTENT_CACHE_SIZE: int = 4096
+    KEYWORD_INTENT_CLASSIFIER: bool = False
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:5173"]
@@ -6,10 +6,12 @@ Provides AI-powered reply suggestions based on conversation context.
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import make_asgi_app
 
 from app.core.config import settings
+from app.services.cache_service import cache_service
 from app.services.reply_service import reply_service
 from app.api import health, replies
 
@@ -17,11 +19,12 @@ from app.api import health, replies
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    # Startup - initialize ML models
+    # Startup - connect cache and initialize ML models
+    await cache_service.initialize()
     await reply_service.initialize()
     yield
     # Shutdown
-    pass
+    await cache_service.close()
 
 
 app = FastAPI(
@@ -32,6 +35,7 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
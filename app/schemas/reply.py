@@ -1,10 +1,12 @@
 """Reply schema definitions."""
 
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, List, Optional
 from enum import Enum
 
+import msgspec
+from msgspec import Meta
+
 
 class ReplyTone(str, Enum):
     """Reply tone options."""
@@ -30,51 +32,56 @@ class ReplyIntent(str, Enum):
     GENERAL = "general"
 
 
-class Message(BaseModel):
+class Message(msgspec.Struct, kw_only=True):
     """A message in a conversation."""
 
     id: Optional[str] = None
-    content: str = Field(..., min_length=1, max_length=4000)
+    content: Annotated[str, Meta(min_length=1, max_length=4000)]
     sender_id: str
     sender_name: Optional[str] = None
     timestamp: Optional[datetime] = None
     is_current_user: bool = False
 
 
-class ConversationContext(BaseModel):
+class ConversationContext(msgspec.Struct, kw_only=True):
     """Conversation context for reply generation."""
 
-    messages: List[Message] = Field(
-        ..., min_length=1, max_length=20, description="Recent messages in the conversation"
-    )
+    messages: Annotated[
+        List[Message],
+        Meta(
+            min_length=1,
+            max_length=20,
+            description="Recent messages in the conversation",
+        ),
+    ]
     channel_name: Optional[str] = None
     channel_type: Optional[str] = None  # "dm", "channel", "thread"
     workspace_id: Optional[str] = None
 
 
-class ReplyRequest(BaseModel):
+class ReplyRequest(msgspec.Struct, kw_only=True):
     """Request for smart reply suggestions."""
 
     context: ConversationContext
     current_user_id: str
     current_user_name: Optional[str] = None
     tone: ReplyTone = ReplyTone.PROFESSIONAL
-    num_suggestions: int = Field(default=3, ge=1, le=5)
-    max_length: int = Field(default=100, ge=10, le=500)
+    num_suggestions: Annotated[int, Meta(ge=1, le=5)] = 3
+    max_length: Annotated[int, Meta(ge=10, le=500)] = 100
     include_quick_replies: bool = True
 
 
-class ReplySuggestion(BaseModel):
+class ReplySuggestion(msgspec.Struct, kw_only=True, frozen=True):
     """A single reply suggestion."""
 
     text: str
-    confidence: float = Field(..., ge=0.0, le=1.0)
+    confidence: Annotated[float, Meta(ge=0.0, le=1.0)]
     intent: ReplyIntent
     tone: ReplyTone
     is_quick_reply: bool = False
 
 
-class ReplyResponse(BaseModel):
+class ReplyResponse(msgspec.Struct, kw_only=True):
     """Response with reply suggestions."""
 
     suggestions: List[ReplySuggestion]
@@ -83,14 +90,14 @@ class ReplyResponse(BaseModel):
     model_version: str = "1.0.0"
 
 
-class QuickReplyRequest(BaseModel):
+class QuickReplyRequest(msgspec.Struct, kw_only=True):
     """Request for quick reply options."""
 
-    last_message: str = Field(..., min_length=1, max_length=4000)
+    last_message: Annotated[str, Meta(min_length=1, max_length=4000)]
     sender_name: Optional[str] = None
 
 
-class QuickReplyResponse(BaseModel):
+class QuickReplyResponse(msgspec.Struct, kw_only=True):
     """Quick reply options response."""
 
     replies: List[str]
@@ -1,4 +1,5 @@
 # Services
+from app.services.cache_service import cache_service
 from app.services.reply_service import reply_service
 
-__all__ = ["reply_service"]
+__all__ = ["cache_service", "reply_service"]
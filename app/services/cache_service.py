@@ -0,0 +1,105 @@
+"""Redis-backed cache for generated replies."""
+
+import time
+from typing import Optional
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+# Backoff between attempts to reach Redis after a failure (seconds)
+_RETRY_BASE_SECONDS = 1.0
+_RETRY_MAX_SECONDS = 30.0
+
+
+class CacheService:
+    """Thin async Redis wrapper that degrades to a no-op when unavailable.
+
+    After a failed command the cache is skipped until a retry time, backing
+    off exponentially, so an unreachable Redis costs at most one timeout per
+    backoff window instead of one per request.
+    """
+
+    def __init__(self):
+        self.redis = None
+        self._retry_at = 0.0
+        self._backoff = _RETRY_BASE_SECONDS
+
+    async def initialize(self) -> None:
+        """Create the Redis client and check the connection."""
+        try:
+            import redis.asyncio as redis
+
+            # Short timeouts so a slow or unreachable Redis can't stall requests
+            self.redis = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD or None,
+                socket_connect_timeout=settings.REDIS_TIMEOUT,
+                socket_timeout=settings.REDIS_TIMEOUT,
+                decode_responses=False,
+            )
+        except Exception as e:
+            logger.warning(f"Redis client unavailable, caching disabled: {e}")
+            return
+
+        try:
+            await self.redis.ping()
+            logger.info("Connected to Redis cache")
+        except Exception as e:
+            self._mark_down(e)
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached value, or None on miss or error."""
+        if not self._available():
+            return None
+
+        try:
+            value = await self.redis.get(key)
+        except Exception as e:
+            self._mark_down(e)
+            return None
+
+        self._mark_up()
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Store a value with the configured TTL."""
+        if not self._available():
+            return
+
+        try:
+            await self.redis.set(key, value, ex=settings.CACHE_TTL)
+        except Exception as e:
+            self._mark_down(e)
+            return
+
+        self._mark_up()
+
+    def _available(self) -> bool:
+        """Whether a client exists and we're not waiting out a backoff."""
+        return self.redis is not None and time.monotonic() >= self._retry_at
+
+    def _mark_up(self) -> None:
+        """Reset the backoff after a successful command."""
+        if self._backoff != _RETRY_BASE_SECONDS:
+            logger.info("Redis cache reachable again")
+            self._backoff = _RETRY_BASE_SECONDS
+
+    def _mark_down(self, error: Exception) -> None:
+        """Skip the cache until the next retry time and grow the backoff."""
+        logger.warning(f"Redis unavailable, retrying in {self._backoff:.0f}s: {error}")
+        self._retry_at = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, _RETRY_MAX_SECONDS)
+
+
+# Global cache instance
+cache_service = CacheService()
@@ -0,0 +1,111 @@
+"""Keyword-weighted intent classifier for the template fallback path."""
+
+import re
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+from app.schemas.reply import ReplyIntent
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Intents the classifier can emit, in tie-break priority order
+INTENTS = [
+    ReplyIntent.GREETING,
+    ReplyIntent.FAREWELL,
+    ReplyIntent.THANKS,
+    ReplyIntent.QUESTION,
+]
+
+# Keyword (or two-word phrase) -> (intent, weight)
+KEYWORDS: Dict[str, Tuple[ReplyIntent, float]] = {
+    "hi": (ReplyIntent.GREETING, 1.0),
+    "hello": (ReplyIntent.GREETING, 1.0),
+    "hey": (ReplyIntent.GREETING, 1.0),
+    "good morning": (ReplyIntent.GREETING, 1.5),
+    "good afternoon": (ReplyIntent.GREETING, 1.5),
+    "bye": (ReplyIntent.FAREWELL, 1.0),
+    "goodbye": (ReplyIntent.FAREWELL, 1.5),
+    "see you": (ReplyIntent.FAREWELL, 1.0),
+    "talk later": (ReplyIntent.FAREWELL, 1.0),
+    "take care": (ReplyIntent.FAREWELL, 1.0),
+    "thank": (ReplyIntent.THANKS, 1.0),
+    "thanks": (ReplyIntent.THANKS, 1.0),
+    "appreciate": (ReplyIntent.THANKS, 1.0),
+    "grateful": (ReplyIntent.THANKS, 1.0),
+    "what": (ReplyIntent.QUESTION, 0.5),
+    "how": (ReplyIntent.QUESTION, 0.5),
+    "why": (ReplyIntent.QUESTION, 0.5),
+    "when": (ReplyIntent.QUESTION, 0.5),
+    "where": (ReplyIntent.QUESTION, 0.5),
+    "who": (ReplyIntent.QUESTION, 0.5),
+    "could you": (ReplyIntent.QUESTION, 1.0),
+    "can you": (ReplyIntent.QUESTION, 1.0),
+    "?": (ReplyIntent.QUESTION, 1.0),
+}
+
+# Split on apostrophes too, so "what's" still yields the "what" keyword
+_WORD_RE = re.compile(r"[a-z]+")
+# Same trailing "?" rule as the regex QUESTION pattern (also before a final \n)
+_QUESTION_END_RE = re.compile(r"\?$")
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _score(token_ids, weights):
+        """Sum per-intent weights over tokens and return the argmax, or -1."""
+        totals = np.zeros(weights.shape[1])
+        for t in token_ids:
+            totals += weights[t]
+
+        best = -1
+        best_score = 0.0
+        for j in range(totals.shape[0]):
+            if totals[j] > best_score:
+                best = j
+                best_score = totals[j]
+        return best
+
+
+class KeywordIntentClassifier:
+    """Scores messages against a fixed keyword vocabulary with a jitted loop."""
+
+    def __init__(self):
+        self._vocab = {keyword: i for i, keyword in enumerate(KEYWORDS)}
+        self._weights = np.zeros((len(KEYWORDS), len(INTENTS)))
+        for keyword, (intent, weight) in KEYWORDS.items():
+            self._weights[self._vocab[keyword], INTENTS.index(intent)] = weight
+
+        # Compile up front so the first request doesn't pay for it
+        _score(np.zeros(0, dtype=np.uint32), self._weights)
+
+    def classify(self, text_lower: str) -> ReplyIntent:
+        """Classify lowercased text, returning GENERAL when nothing matches."""
+        token_ids = []
+        prev = None
+        for word in _WORD_RE.findall(text_lower):
+            token_id = self._vocab.get(word)
+            if token_id is not None:
+                token_ids.append(token_id)
+            if prev is not None:
+                token_id = self._vocab.get(f"{prev} {word}")
+                if token_id is not None:
+                    token_ids.append(token_id)
+            prev = word
+
+        if _QUESTION_END_RE.search(text_lower):
+            token_ids.append(self._vocab["?"])
+
+        best = _score(np.array(token_ids, dtype=np.uint32), self._weights)
+        return INTENTS[best] if best >= 0 else ReplyIntent.GENERAL
+
+
+def load_keyword_classifier() -> Optional[KeywordIntentClassifier]:
+    """Build the classifier, or return None when Numba is not installed."""
+    if njit is None:
+        return None
+    return KeywordIntentClassifier()
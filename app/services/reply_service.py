@@ -1,11 +1,15 @@
 """Smart reply generation service."""
 
+import functools
+import hashlib
 import time
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import msgspec
 import structlog
 
 from app.core.config import settings
+from app.services.cache_service import cache_service
 from app.schemas.reply import (
     ReplyRequest,
     ReplySuggestion,
@@ -19,6 +23,8 @@ from app.schemas.reply import (
 
 logger = structlog.get_logger()
 
+_SPECIAL_TOKEN_RE = re.compile(r"<\|.*?\|>")
+
 
 class SmartReplyService:
     """Service for generating smart reply suggestions."""
@@ -28,6 +34,9 @@ class SmartReplyService:
         self.tokenizer = None
         self.embedding_model = None
         self.initialized = False
+        self._pad_id = None
+        self._eos_str = ""
+        self._keyword_classifier = None
 
         # Quick reply templates by intent
         self.quick_reply_templates = {
@@ -73,14 +82,65 @@ class SmartReplyService:
             ],
         }
 
-        # Intent detection patterns
+        # Tone-adjusted templates, precomputed for every (intent, tone) pair
+        self._templates_by_tone = {
+            (intent, tone): [self._adjust_for_tone(t, tone) for t in templates]
+            for intent, templates in self.quick_reply_templates.items()
+            for tone in ReplyTone
+        }
+
+        # Prebuilt suggestions for the closed (intent, tone) space, shared
+        # between requests (ReplySuggestion is frozen)
+        self._quick_suggestion_cache = {
+            (intent, tone): [
+                ReplySuggestion(
+                    text=template,
+                    confidence=0.8 - (i * 0.1),
+                    intent=intent,
+                    tone=tone,
+                    is_quick_reply=True,
+                )
+                for i, template in enumerate(templates)
+            ]
+            for (intent, tone), templates in self._templates_by_tone.items()
+        }
+        self._fallback_suggestion_cache = {
+            (intent, tone): [
+                ReplySuggestion(
+                    text=template,
+                    confidence=0.6 - (i * 0.1),
+                    intent=intent,
+                    tone=tone,
+                    is_quick_reply=True,
+                )
+                for i, template in enumerate(
+                    self._templates_by_tone.get(
+                        (intent, tone),
+                        self._templates_by_tone[(ReplyIntent.ACKNOWLEDGE, tone)],
+                    )
+                )
+            ]
+            for intent in ReplyIntent
+            for tone in ReplyTone
+        }
+
+        # Intent detection patterns, in priority order
         self.intent_patterns = {
-            ReplyIntent.GREETING: r"\b(hi|hello|hey|good morning|good afternoon)\b",
-            ReplyIntent.FAREWELL: r"\b(bye|goodbye|see you|talk later|take care)\b",
-            ReplyIntent.THANKS: r"\b(thank|thanks|appreciate|grateful)\b",
-            ReplyIntent.QUESTION: r"\?$|\b(what|how|why|when|where|who|could you|can you)\b",
+            intent: re.compile(pattern, re.IGNORECASE)
+            for intent, pattern in {
+                ReplyIntent.GREETING: r"\b(hi|hello|hey|good morning|good afternoon)\b",
+                ReplyIntent.FAREWELL: r"\b(bye|goodbye|see you|talk later|take care)\b",
+                ReplyIntent.THANKS: r"\b(thank|thanks|appreciate|grateful)\b",
+                ReplyIntent.QUESTION: (
+                    r"\?$|\b(what|how|why|when|where|who|could you|can you)\b"
+                ),
+            }.items()
         }
 
+        # Memoized intent lookup keyed by lowercased text
+        intent_cache = functools.lru_cache(maxsize=settings.INTENT_CACHE_SIZE)
+        self._intent_lookup = intent_cache(self._match_intent)
+
     async def initialize(self) -> None:
         """Initialize ML models."""
         try:
@@ -90,11 +150,25 @@ class SmartReplyService:
 
             self.tokenizer = AutoTokenizer.from_pretrained(settings.REPLY_MODEL)
             self.model = AutoModelForCausalLM.from_pretrained(settings.REPLY_MODEL)
+            self.model.eval()
+
+            # Quantize Linear layers to int8 for faster CPU inference. In place,
+            # to avoid holding a second full-precision copy during load.
+            if settings.QUANTIZE_MODEL:
+                import torch
+
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+                )
 
             # Set pad token
             if self.tokenizer.pad_token is None:
                 self.tokenizer.pad_token = self.tokenizer.eos_token
 
+            # Cache token values used on every generation
+            self._pad_id = self.tokenizer.pad_token_id
+            self._eos_str = self.tokenizer.eos_token
+
             self.initialized = True
             logger.info("Smart reply models loaded successfully")
 
@@ -102,12 +176,20 @@ class SmartReplyService:
             logger.warning(f"Failed to load ML models, using fallback: {e}")
             self.initialized = False
 
+        # Optional keyword classifier for intent detection in fallback mode
+        if not self.initialized and settings.KEYWORD_INTENT_CLASSIFIER:
+            from app.services.keyword_intent import load_keyword_classifier
+
+            self._keyword_classifier = load_keyword_classifier()
+            if self._keyword_classifier is None:
+                logger.warning("Numba not installed, using regex intent detection")
+
     async def generate_replies(self, request: ReplyRequest) -> ReplyResponse:
         """Generate smart reply suggestions."""
         start_time = time.time()
 
-        # Build context string
-        context_str = self._build_context_string(request.context.messages)
+        # Build context string and summary
+        context_str, context_summary = self._analyze_messages(request.context.messages)
 
         # Detect intent from last message
         last_message = request.context.messages[-1]
@@ -115,56 +197,102 @@ class SmartReplyService:
 
         suggestions = []
 
-        # Generate ML-based suggestions if available
-        if self.initialized and self.model is not None:
-            ml_suggestions = await self._generate_ml_replies(
-                context_str,
-                request.num_suggestions,
-                request.max_length,
-                request.tone,
-            )
-            suggestions.extend(ml_suggestions)
-
-        # Add quick replies if requested
-        if request.include_quick_replies:
-            quick_replies = self._get_quick_replies(detected_intent, request.tone)
-            suggestions.extend(quick_replies)
-
-        # If no ML suggestions, use template-based fallback
-        if not suggestions:
-            suggestions = self._generate_fallback_replies(
-                last_message.content,
-                detected_intent,
-                request.tone,
-                request.num_suggestions,
-            )
+        # Only the ML path is worth a cache round trip
+        use_ml = self.initialized and self.model is not None
+        cache_key = self._cache_key(context_str, request) if use_ml else None
+        cached = await cache_service.get(cache_key) if cache_key else None
+
+        if cached is not None:
+            suggestions = msgspec.json.decode(cached, type=List[ReplySuggestion])
+        else:
+            ml_suggestions = []
+
+            # Generate ML-based suggestions if available
+            if use_ml:
+                ml_suggestions = await self._generate_ml_replies(
+                    context_str,
+                    request.num_suggestions,
+                    request.max_length,
+                    request.tone,
+                )
+                suggestions.extend(ml_suggestions)
+
+            # Add quick replies if requested
+            if request.include_quick_replies:
+                quick_replies = self._get_quick_replies(detected_intent, request.tone)
+                suggestions.extend(quick_replies)
+
+            # If no ML suggestions, use template-based fallback
+            if not suggestions:
+                suggestions = self._generate_fallback_replies(
+                    last_message.content,
+                    detected_intent,
+                    request.tone,
+                    request.num_suggestions,
+                )
 
-        # Sort by confidence and limit
-        suggestions = sorted(suggestions, key=lambda x: x.confidence, reverse=True)
-        suggestions = suggestions[: request.num_suggestions]
+            # Sort by confidence and limit
+            suggestions = sorted(suggestions, key=lambda x: x.confidence, reverse=True)
+            suggestions = suggestions[: request.num_suggestions]
+
+            # Don't pin a failed generation in the cache
+            if cache_key and ml_suggestions:
+                await cache_service.set(cache_key, msgspec.json.encode(suggestions))
 
         processing_time = (time.time() - start_time) * 1000
 
         return ReplyResponse(
             suggestions=suggestions,
-            context_summary=self._summarize_context(request.context.messages),
+            context_summary=context_summary,
             processing_time_ms=processing_time,
         )
 
-    def _build_context_string(self, messages: List[Message]) -> str:
-        """Build a context string from messages."""
+    def _cache_key(self, context_str: str, request: ReplyRequest) -> str:
+        """Build the reply cache key for a context and generation options."""
+        options = (
+            settings.REPLY_MODEL,
+            settings.QUANTIZE_MODEL,
+            request.tone.value,
+            request.num_suggestions,
+            request.max_length,
+            request.include_quick_replies,
+        )
+        digest = hashlib.blake2b(
+            context_str.encode() + str(options).encode(), digest_size=16
+        ).hexdigest()
+        return f"reply:{digest}"
+
+    def _analyze_messages(self, messages: List[Message]) -> Tuple[str, str]:
+        """Build the context string and summary in a single pass over messages."""
+        if not messages:
+            return "", "No context available"
+
+        context_start = len(messages) - settings.MAX_CONTEXT_MESSAGES
         context_parts = []
-        for msg in messages[-settings.MAX_CONTEXT_MESSAGES :]:
-            sender = msg.sender_name or msg.sender_id
-            context_parts.append(f"{sender}: {msg.content}")
-        return "\n".join(context_parts)
+        senders = set()
+        for i, msg in enumerate(messages):
+            senders.add(msg.sender_id)
+            if i >= context_start:
+                sender = msg.sender_name or msg.sender_id
+                context_parts.append(f"{sender}: {msg.content}")
+
+        summary = (
+            f"Conversation with {len(senders)} participant(s), "
+            f"{len(messages)} recent message(s)"
+        )
+        return "\n".join(context_parts), summary
 
     def _detect_intent(self, text: str) -> ReplyIntent:
         """Detect the intent of a message."""
-        text_lower = text.lower()
+        return self._intent_lookup(text.lower())
+
+    def _match_intent(self, text_lower: str) -> ReplyIntent:
+        """Match lowercased text against the intent patterns."""
+        if self._keyword_classifier is not None:
+            return self._keyword_classifier.classify(text_lower)
 
         for intent, pattern in self.intent_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
+            if pattern.search(text_lower):
                 return intent
 
         return ReplyIntent.GENERAL
@@ -180,32 +308,36 @@ class SmartReplyService:
         suggestions = []
 
         try:
+            import torch
+
             # Encode context
             inputs = self.tokenizer.encode(
-                context + self.tokenizer.eos_token,
+                context + self._eos_str,
                 return_tensors="pt",
                 truncation=True,
                 max_length=512,
             )
 
             # Generate multiple responses
-            outputs = self.model.generate(
-                inputs,
-                max_length=inputs.shape[1] + max_length,
-                num_return_sequences=num_suggestions,
-                do_sample=True,
-                top_p=0.92,
-                top_k=50,
-                temperature=0.7,
-                pad_token_id=self.tokenizer.pad_token_id,
-                no_repeat_ngram_size=3,
-            )
+            with torch.inference_mode():
+                outputs = self.model.generate(
+                    inputs,
+                    max_length=inputs.shape[1] + max_length,
+                    num_return_sequences=num_suggestions,
+                    do_sample=True,
+                    top_p=0.92,
+                    top_k=50,
+                    temperature=0.7,
+                    pad_token_id=self._pad_id,
+                    no_repeat_ngram_size=3,
+                )
+
+            # Decode only the newly generated tokens, in a single tokenizer call
+            new_tokens = outputs[:, inputs.shape[1] :]
+            texts = self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)
 
-            for i, output in enumerate(outputs):
-                # Decode and extract just the generated part
-                full_text = self.tokenizer.decode(output, skip_special_tokens=True)
-                # Remove the context part
-                reply_text = full_text[len(context) :].strip()
+            for i, text in enumerate(texts):
+                reply_text = text.strip()
 
                 if reply_text and len(reply_text) > 3:
                     # Clean up the reply
@@ -215,7 +347,8 @@ class SmartReplyService:
                         ReplySuggestion(
                             text=reply_text,
                             confidence=0.7 - (i * 0.1),  # Decreasing confidence
-                            intent=self._detect_intent(reply_text),
+                            # Sampled text never repeats; bypass the LRU
+                            intent=self._match_intent(reply_text.lower()),
                             tone=tone,
                             is_quick_reply=False,
                         )
@@ -229,38 +362,22 @@ class SmartReplyService:
     def _clean_reply(self, text: str) -> str:
         """Clean up generated reply text."""
         # Remove any remaining special tokens
-        text = re.sub(r"<\|.*?\|>", "", text)
+        text = _SPECIAL_TOKEN_RE.sub("", text)
         # Remove extra whitespace
         text = " ".join(text.split())
-        # Capitalize first letter
-        if text:
-            text = text[0].upper() + text[1:]
-        # Ensure proper ending
-        if text and text[-1] not in ".!?":
-            text += "."
-        return text
+        if not text:
+            return text
+        # Capitalize first letter and ensure proper ending
+        if text[-1] not in ".!?":
+            return f"{text[0].upper()}{text[1:]}."
+        return f"{text[0].upper()}{text[1:]}"
 
     def _get_quick_replies(
         self, intent: ReplyIntent, tone: ReplyTone
     ) -> List[ReplySuggestion]:
         """Get quick reply suggestions based on intent."""
-        templates = self.quick_reply_templates.get(intent, [])
-
-        suggestions = []
-        for i, template in enumerate(templates[:2]):  # Max 2 quick replies
-            # Adjust template based on tone
-            adjusted = self._adjust_for_tone(template, tone)
-            suggestions.append(
-                ReplySuggestion(
-                    text=adjusted,
-                    confidence=0.8 - (i * 0.1),
-                    intent=intent,
-                    tone=tone,
-                    is_quick_reply=True,
-                )
-            )
-
-        return suggestions
+        # Max 2 quick replies
+        return self._quick_suggestion_cache.get((intent, tone), [])[:2]
 
     def _adjust_for_tone(self, text: str, tone: ReplyTone) -> str:
         """Adjust reply text based on tone."""
@@ -296,36 +413,7 @@ class SmartReplyService:
         num_suggestions: int,
     ) -> List[ReplySuggestion]:
         """Generate fallback replies when ML model is unavailable."""
-        suggestions = []
-
-        # Get templates for detected intent
-        templates = self.quick_reply_templates.get(
-            intent, self.quick_reply_templates[ReplyIntent.ACKNOWLEDGE]
-        )
-
-        for i, template in enumerate(templates[:num_suggestions]):
-            adjusted = self._adjust_for_tone(template, tone)
-            suggestions.append(
-                ReplySuggestion(
-                    text=adjusted,
-                    confidence=0.6 - (i * 0.1),
-                    intent=intent,
-                    tone=tone,
-                    is_quick_reply=True,
-                )
-            )
-
-        return suggestions
-
-    def _summarize_context(self, messages: List[Message]) -> str:
-        """Create a brief summary of the conversation context."""
-        if not messages:
-            return "No context available"
-
-        num_messages = len(messages)
-        unique_senders = len(set(m.sender_id for m in messages))
-
-        return f"Conversation with {unique_senders} participant(s), {num_messages} recent message(s)"
+        return self._fallback_suggestion_cache[(intent, tone)][:num_suggestions]
 
     async def get_quick_replies(self, request: QuickReplyRequest) -> QuickReplyResponse:
         """Get quick reply options for a message."""
@@ -0,0 +1,67 @@
+"""Tests for the keyword intent classifier."""
+
+import pytest
+
+pytest.importorskip("numba")
+
+from app.schemas.reply import ReplyIntent  # noqa: E402
+from app.services.keyword_intent import (  # noqa: E402
+    KeywordIntentClassifier,
+    load_keyword_classifier,
+)
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return KeywordIntentClassifier()
+
+
+def test_load_returns_classifier_when_numba_installed():
+    assert isinstance(load_keyword_classifier(), KeywordIntentClassifier)
+
+
+def test_no_keywords_is_general(classifier):
+    assert classifier.classify("sounds fine") == ReplyIntent.GENERAL
+    assert classifier.classify("") == ReplyIntent.GENERAL
+
+
+def test_single_keyword(classifier):
+    assert classifier.classify("hello") == ReplyIntent.GREETING
+    assert classifier.classify("much appreciated, grateful") == ReplyIntent.THANKS
+
+
+def test_bigram_phrases(classifier):
+    assert classifier.classify("see you tomorrow") == ReplyIntent.FAREWELL
+    assert classifier.classify("could you send it") == ReplyIntent.QUESTION
+    # "good" and "morning" alone are not keywords
+    assert classifier.classify("good") == ReplyIntent.GENERAL
+    assert classifier.classify("good morning team") == ReplyIntent.GREETING
+
+
+def test_trailing_question_mark(classifier):
+    assert classifier.classify("lunch?") == ReplyIntent.QUESTION
+    assert classifier.classify("lunch? ok") == ReplyIntent.GENERAL
+
+
+def test_trailing_question_mark_before_newline(classifier):
+    assert classifier.classify("lunch?\n") == ReplyIntent.QUESTION
+    assert classifier.classify("lunch? ") == ReplyIntent.GENERAL
+
+
+@pytest.mark.parametrize(
+    "text", ["what's up", "how's it going", "who's there", "where's the doc"]
+)
+def test_contractions_keep_question_words(classifier, text):
+    assert classifier.classify(text) == ReplyIntent.QUESTION
+
+
+def test_weights_are_summed(classifier):
+    # question word (0.5) + trailing "?" (1.0) outweighs a single greeting
+    assert classifier.classify("hi, how are you?") == ReplyIntent.QUESTION
+    assert classifier.classify("thanks, thanks, bye") == ReplyIntent.THANKS
+
+
+def test_ties_follow_priority_order(classifier):
+    # FAREWELL and THANKS both score 1.0; FAREWELL ranks first
+    assert classifier.classify("thanks, see you") == ReplyIntent.FAREWELL
+    assert classifier.classify("hey, thanks") == ReplyIntent.GREETING
@@ -0,0 +1,116 @@
+"""Tests for the smart reply API endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    # No lifespan: the service runs in template fallback mode without Redis
+    return TestClient(app)
+
+
+def suggest_body(**overrides):
+    body = {
+        "context": {"messages": [{"content": "Thanks a lot!", "sender_id": "a"}]},
+        "current_user_id": "u",
+    }
+    body.update(overrides)
+    return body
+
+
+def test_suggest_returns_suggestions(client):
+    response = client.post("/api/v1/replies/suggest", json=suggest_body())
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["suggestions"][0]["intent"] == "thanks"
+    assert data["context_summary"].startswith("Conversation with 1 participant(s)")
+
+
+def test_quick_returns_replies(client):
+    response = client.post("/api/v1/replies/quick", json={"last_message": "hello"})
+
+    assert response.status_code == 200
+    assert response.json()["intent"] == "greeting"
+
+
+def test_missing_field(client):
+    body = suggest_body()
+    del body["current_user_id"]
+
+    response = client.post("/api/v1/replies/suggest", json=body)
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["loc"] == ["body", "current_user_id"]
+    assert error["type"] == "value_error"
+    assert error["msg"] == "Object missing required field `current_user_id`"
+
+
+def test_missing_nested_field(client):
+    body = suggest_body(context={"messages": [{"content": "hi"}]})
+
+    response = client.post("/api/v1/replies/suggest", json=body)
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["loc"] == ["body", "context", "messages", 0, "sender_id"]
+
+
+def test_bound_violation(client):
+    response = client.post(
+        "/api/v1/replies/suggest", json=suggest_body(num_suggestions=9)
+    )
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["loc"] == ["body", "num_suggestions"]
+    assert "<= 5" in error["msg"]
+
+
+def test_nested_list_index(client):
+    body = suggest_body(context={"messages": [{"content": "", "sender_id": "a"}]})
+
+    response = client.post("/api/v1/replies/suggest", json=body)
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["loc"] == ["body", "context", "messages", 0, "content"]
+
+
+def test_empty_messages(client):
+    body = suggest_body(context={"messages": []})
+
+    response = client.post("/api/v1/replies/suggest", json=body)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "context", "messages"]
+
+
+def test_malformed_json(client):
+    response = client.post(
+        "/api/v1/replies/quick",
+        content=b'{"last_message": ',
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body"]
+
+
+def test_openapi_documents_bodies(client):
+    paths = client.get("/openapi.json").json()["paths"]
+
+    suggest = paths["/api/v1/replies/suggest"]["post"]
+    request_schema = suggest["requestBody"]["content"]["application/json"]["schema"]
+    assert "context" in request_schema["properties"]
+    response_schema = suggest["responses"]["200"]["content"]["application/json"][
+        "schema"
+    ]
+    assert "suggestions" in response_schema["properties"]
+    assert "$ref" not in str(request_schema)
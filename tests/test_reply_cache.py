@@ -0,0 +1,177 @@
+"""Tests for the Redis reply cache."""
+
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.reply import (
+    ConversationContext,
+    Message,
+    ReplyIntent,
+    ReplyRequest,
+    ReplySuggestion,
+    ReplyTone,
+)
+from app.services.cache_service import CacheService, cache_service
+from app.services.reply_service import SmartReplyService
+
+# The package re-exports the instance under the module's name
+cache_module = importlib.import_module("app.services.cache_service")
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis."""
+
+    def __init__(self, fail: bool = False):
+        self.store = {}
+        self.fail = fail
+        self.calls = 0
+
+    async def ping(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("connection refused")
+        return True
+
+    async def get(self, key):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("connection refused")
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("connection refused")
+        self.store[key] = value
+
+    async def aclose(self):
+        pass
+
+
+def make_request(**overrides) -> ReplyRequest:
+    context = ConversationContext(
+        messages=[
+            Message(content="Can you review the doc?", sender_id="a"),
+            Message(content="Sure, sending it now", sender_id="b"),
+        ]
+    )
+    return ReplyRequest(context=context, current_user_id="u", **overrides)
+
+
+def ml_reply(text: str = "Looks good to me.") -> ReplySuggestion:
+    return ReplySuggestion(
+        text=text,
+        confidence=0.7,
+        intent=ReplyIntent.GENERAL,
+        tone=ReplyTone.PROFESSIONAL,
+    )
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache_service, "redis", fake)
+    monkeypatch.setattr(cache_service, "_retry_at", 0.0)
+    return fake
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = SmartReplyService()
+    service.initialized = True
+    service.model = object()
+    service.ml_calls = 0
+
+    async def fake_generate(context, num_suggestions, max_length, tone):
+        service.ml_calls += 1
+        return service.ml_results
+
+    service.ml_results = [ml_reply()]
+    monkeypatch.setattr(service, "_generate_ml_replies", fake_generate)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_miss_then_hit(service, fake_redis):
+    first = await service.generate_replies(make_request())
+    second = await service.generate_replies(make_request())
+
+    assert service.ml_calls == 1
+    assert len(fake_redis.store) == 1
+    assert [s.text for s in second.suggestions] == [s.text for s in first.suggestions]
+    assert second.suggestions[0].intent == ReplyIntent.GENERAL
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_is_not_cached(service, fake_redis):
+    service.ml_results = []
+
+    await service.generate_replies(make_request())
+    await service.generate_replies(make_request())
+
+    assert fake_redis.store == {}
+    assert service.ml_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_fallback_mode_skips_cache(service, fake_redis):
+    service.initialized = False
+
+    await service.generate_replies(make_request())
+
+    assert fake_redis.calls == 0
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"tone": ReplyTone.CASUAL},
+        {"num_suggestions": 2},
+        {"max_length": 50},
+        {"include_quick_replies": False},
+    ],
+)
+def test_cache_key_varies_with_request_options(overrides):
+    service = SmartReplyService()
+    base = service._cache_key("ctx", make_request())
+
+    assert service._cache_key("ctx", make_request(**overrides)) != base
+    assert service._cache_key("other", make_request()) != base
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [("REPLY_MODEL", "microsoft/DialoGPT-small"), ("QUANTIZE_MODEL", True)],
+)
+def test_cache_key_varies_with_model(monkeypatch, setting, value):
+    service = SmartReplyService()
+    base = service._cache_key("ctx", make_request())
+
+    monkeypatch.setattr(settings, setting, value)
+
+    assert service._cache_key("ctx", make_request()) != base
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_backs_off_then_retries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    cache = CacheService()
+    cache.redis = FakeRedis(fail=True)
+
+    assert await cache.get("k") is None
+    assert cache.redis.calls == 1
+
+    # Within the backoff window the cache is skipped without touching Redis
+    assert await cache.get("k") is None
+    await cache.set("k", b"v")
+    assert cache.redis.calls == 1
+
+    # After the window, Redis is tried again and recovers
+    now[0] += 1.5
+    cache.redis.fail = False
+    await cache.set("k", b"v")
+    assert await cache.get("k") == b"v"